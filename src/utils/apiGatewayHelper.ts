@@ -131,7 +131,6 @@ export async function callApiGateway(
     const response = await fetch(url, options);
     
     if (!response.ok) {
-      const errorText = await response.text();
       throw new Error(`API request failed: ${response.status}`);
     }
     
@@ -121,14 +121,6 @@ export const diagnoseGeoTiffUrl = async (url: string): Promise<{
       };
     }
     
-    // Check if the URL seems to be for a GeoTIFF file
-    const isLikelyGeoTiff = url.toLowerCase().includes('.tif') || 
-                            url.toLowerCase().includes('geotiff') ||
-                            url.toLowerCase().includes('tiff');
-                            
-    if (!isLikelyGeoTiff) {
-    }
-    
     // Use HEAD request to check if the resource is accessible
     const response = await fetch(url, {
       method: 'HEAD',
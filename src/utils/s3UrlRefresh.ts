@@ -87,8 +87,6 @@ export const refreshPresignedUrl = async (url: string): Promise<string> => {
   }
   
   try {
-    console.log('Refreshing pre-signed URL:', url.substring(0, 50) + '...');
-    
     const refreshedUrl = await getPresignedViewUrl(url);
     
     // Cache the result
@@ -97,7 +95,6 @@ export const refreshPresignedUrl = async (url: string): Promise<string> => {
       timestamp: Date.now()
     });
     
-    console.log('Successfully refreshed URL');
     return refreshedUrl;
   } catch (error) {
     console.warn('Failed to refresh pre-signed URL:', error);
@@ -126,8 +123,6 @@ export const refreshMultipleUrls = async (urls: string[]): Promise<Map<string, s
     return results;
   }
   
-  console.log(`Refreshing ${urlsToRefresh.length} URLs...`);
-  
   // Refresh URLs in parallel (limit to 5 concurrent requests to avoid overwhelming the API)
   const batchSize = 5;
   for (let i = 0; i < urlsToRefresh.length; i += batchSize) {